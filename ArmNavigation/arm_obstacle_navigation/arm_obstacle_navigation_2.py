@@ -103,30 +103,68 @@ def get_occupancy_grid(arm, obstacles):
     in its environment.
 
     Args:
-        arm: An instance of NLinkArm
+        arm: An instance of NLinkArm with two links
         obstacles: A list of obstacles, with each obstacle defined as a list
                    of xy coordinates and a radius. 
 
     Returns:
         Occupancy grid in joint space
     """
-    grid = [[0 for _ in range(M)] for _ in range(M)]
-    theta_list = [2 * i * pi / M for i in range(-M // 2, M // 2 + 1)]
-    for i in range(M):
-        for j in range(M):
-            arm.update_joints([theta_list[i], theta_list[j]])
-            points = arm.points
-            collision_detected = False
-            for k in range(len(points) - 1):
-                for obstacle in obstacles:
-                    line_seg = [points[k], points[k + 1]]
-                    collision_detected = detect_collision(line_seg, obstacle)
-                    if collision_detected:
-                        break
-                if collision_detected:
-                    break
-            grid[i][j] = int(collision_detected)
-    return np.array(grid)
+    if arm.n_links != 2:
+        raise ValueError("The joint space grid requires a 2-link arm, "
+                         f"got {arm.n_links} links.")
+    theta = 2 * pi * np.arange(-M // 2, M // 2) / M
+    joint_angles = np.stack(np.meshgrid(theta, theta, indexing='ij'), axis=-1)
+    joint_points = calc_joint_positions(arm.link_lengths, joint_angles)
+    # cell labels 0-6 fit in int8
+    return detect_collisions(joint_points, obstacles).astype(np.int8)
+
+
+def detect_collisions(points, obstacles):
+    """
+    Vectorized version of detect_collision that checks every link of
+    a batch of arm configurations against every obstacle at once.
+
+    Args:
+        points: Array of joint positions, shape (..., n_links + 1, 2)
+        obstacles: A list of obstacles, with each obstacle defined as a list
+                   of xy coordinates and a radius.
+
+    Returns:
+        Boolean array of shape (...), True where any link of the
+        configuration is in contact with any obstacle
+    """
+    obstacles = np.asarray(obstacles, dtype=float).reshape(-1, 3)
+    # broadcast links (..., n_links, 1, 2) against obstacles (n_obstacles, 2)
+    a_vec = points[..., :-1, np.newaxis, :]
+    line_vec = points[..., 1:, np.newaxis, :] - a_vec
+    circle_vec = obstacles[:, :2] - a_vec
+    proj = np.clip(np.sum(circle_vec * line_vec, axis=-1)
+                   / np.sum(line_vec ** 2, axis=-1), 0.0, 1.0)
+    closest_to_circle = circle_vec - line_vec * proj[..., np.newaxis]
+    dist_sq = np.sum(closest_to_circle ** 2, axis=-1)
+    return np.any(dist_sq <= obstacles[:, 2] ** 2, axis=(-2, -1))
+
+
+def calc_joint_positions(link_lengths, joint_angles):
+    """
+    Computes the joint positions of a planar arm for a batch of
+    joint configurations at once.
+
+    Args:
+        link_lengths: Array of link lengths, shape (n_links,)
+        joint_angles: Array of joint configurations, shape (..., n_links)
+
+    Returns:
+        Joint positions including the base at the origin,
+        shape (..., n_links + 1, 2)
+    """
+    theta_sum = np.cumsum(joint_angles, axis=-1)
+    deltas = np.stack((link_lengths * np.cos(theta_sum),
+                       link_lengths * np.sin(theta_sum)), axis=-1)
+    points = np.zeros(deltas.shape[:-2] + (deltas.shape[-2] + 1, 2))
+    points[..., 1:, :] = np.cumsum(deltas, axis=-2)
+    return points
 
 
 def astar_torus(grid, start_node, goal_node):
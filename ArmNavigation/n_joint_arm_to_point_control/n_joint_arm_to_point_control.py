@@ -18,6 +18,7 @@ Kp = 2
 dt = 0.1
 N_LINKS = 10
 N_ITERATIONS = 10000
+DAMPING = 0.01  # damping factor of the damped least squares IK step
 
 # States
 WAIT_FOR_NEW_GOAL = 1
@@ -67,16 +68,23 @@ def main():  # pragma: no cover
 
 def inverse_kinematics(link_lengths, joint_angles, goal_pos):
     """
-    Calculates the inverse kinematics using the Jacobian inverse method.
+    Calculates the inverse kinematics using the damped least squares
+    Jacobian inverse method.
     """
+    damping_eye = DAMPING ** 2 * np.eye(2)
+    link_lengths = np.asarray(link_lengths, dtype=float)
+    joint_angles = np.array(joint_angles, dtype=float)  # updated in place
+    goal_pos = np.asarray(goal_pos)
     for iteration in range(N_ITERATIONS):
-        current_pos = forward_kinematics(link_lengths, joint_angles)
-        errors, distance = distance_to_goal(current_pos, goal_pos)
-        if distance < 0.1:
+        links = link_vectors(link_lengths, joint_angles)
+        current_pos = np.sum(links, axis=1)
+        errors = goal_pos - current_pos
+        if errors @ errors < 0.1 ** 2:  # squared distance, no sqrt needed
             print("Solution found in %d iterations." % iteration)
             return joint_angles, True
-        J = jacobian_inverse(link_lengths, joint_angles)
-        joint_angles = joint_angles + np.matmul(J, errors)
+        J = jacobian_from_link_vectors(links)
+        JJT = J @ J.T + damping_eye
+        joint_angles += J.T @ np.linalg.solve(JJT, errors)
     return joint_angles, False
 
 
@@ -130,24 +138,38 @@ def animation():
         arm.update_joints(joint_angles)
 
 
+def link_vectors(link_lengths, joint_angles):
+    """
+    Returns the 2xN matrix of link vectors in the world frame, shared by
+    the forward kinematics and the Jacobian.
+    """
+    link_lengths = np.asarray(link_lengths)
+    theta_sum = np.cumsum(joint_angles)
+    return np.array([link_lengths * np.cos(theta_sum),
+                     link_lengths * np.sin(theta_sum)])
+
+
 def forward_kinematics(link_lengths, joint_angles):
-    x = y = 0
-    for i in range(1, N_LINKS + 1):
-        x += link_lengths[i - 1] * np.cos(np.sum(joint_angles[:i]))
-        y += link_lengths[i - 1] * np.sin(np.sum(joint_angles[:i]))
-    return np.array([x, y]).T
-
-
-def jacobian_inverse(link_lengths, joint_angles):
-    J = np.zeros((2, N_LINKS))
-    for i in range(N_LINKS):
-        J[0, i] = 0
-        J[1, i] = 0
-        for j in range(i, N_LINKS):
-            J[0, i] -= link_lengths[j] * np.sin(np.sum(joint_angles[:j]))
-            J[1, i] += link_lengths[j] * np.cos(np.sum(joint_angles[:j]))
-
-    return np.linalg.pinv(J)
+    """
+    Returns the end effector position for the given joint angles.
+    """
+    return np.sum(link_vectors(link_lengths, joint_angles), axis=1)
+
+
+def jacobian(link_lengths, joint_angles):
+    """
+    Returns the 2xN Jacobian of the end effector position with respect to
+    the joint angles. inverse_kinematics uses link_vectors and
+    jacobian_from_link_vectors directly to share the link vectors with FK.
+    """
+    return jacobian_from_link_vectors(link_vectors(link_lengths, joint_angles))
+
+
+def jacobian_from_link_vectors(links):
+    # vector from each joint to the end effector
+    ee_from_joint = np.cumsum(links[:, ::-1], axis=1)[:, ::-1]
+    # rotating it by 90 degrees gives the Jacobian column of that joint
+    return np.array([-ee_from_joint[1], ee_from_joint[0]])
 
 
 def distance_to_goal(current_pos, goal_pos):
@@ -1,6 +1,5 @@
 import math
 import numpy as np
-from scipy.interpolate import interp1d
 from utils.angle import angle_mod
 
 # motion parameter
@@ -32,6 +31,17 @@ def update(state, v, delta, dt, L):
     return state
 
 
+def calc_curvature_profile(t, time, k0, km, kf):
+    """
+    Evaluate the quadratic curvature profile passing through
+    k0, km and kf at 0, time / 2 and time, for all t at once.
+    """
+    u = t / time
+    return (k0 * (2.0 * u - 1.0) * (u - 1.0)
+            - 4.0 * km * u * (u - 1.0)
+            + kf * u * (2.0 * u - 1.0))
+
+
 def generate_trajectory(s, km, kf, k0):
     n = s / ds
     time = s / v  # [s]
@@ -43,11 +53,8 @@ def generate_trajectory(s, km, kf, k0):
     if isinstance(kf, type(np.array([]))):
         kf = kf[0]
 
-    tk = np.array([0.0, time / 2.0, time])
-    kk = np.array([k0, km, kf])
     t = np.arange(0.0, time, time / n)
-    fkp = interp1d(tk, kk, kind="quadratic")
-    kp = [fkp(ti) for ti in t]
+    kp = calc_curvature_profile(t, time, k0, km, kf)
     dt = float(time / n)
 
     #  plt.plot(t, kp)
@@ -78,11 +85,8 @@ def generate_last_state(s, km, kf, k0):
     if isinstance(kf, type(np.array([]))):
         kf = kf[0]
 
-    tk = np.array([0.0, time / 2.0, time])
-    kk = np.array([k0, km, kf])
     t = np.arange(0.0, time, time / n)
-    fkp = interp1d(tk, kk, kind="quadratic")
-    kp = [fkp(ti) for ti in t]
+    kp = calc_curvature_profile(t, time, k0, km, kf)
     dt = time / n
 
     #  plt.plot(t, kp)
@@ -1,15 +1,19 @@
 import conftest
+import pytest
 from PathPlanning.AStar import a_star_searching_from_two_side as m
 
 
-def test1():
+@pytest.fixture(autouse=True)
+def no_animation():
     m.show_animation = False
-    m.main(800)
 
 
-def test2():
-    m.show_animation = False
-    m.main(5000)  # increase obstacle number, block path
+@pytest.mark.parametrize("obstacle_number", [
+    800,
+    5000,  # increase obstacle number, block path
+])
+def test_main(obstacle_number):
+    m.main(obstacle_number)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,49 @@
+import conftest  # Add root path to sys.path
+import numpy as np
+import pytest
+from ArmNavigation.arm_obstacle_navigation \
+    import arm_obstacle_navigation as m
+
+
+def test_detect_collisions_matches_detect_collision():
+    rng = np.random.default_rng(12345)
+    for _ in range(1000):
+        line_seg = rng.uniform(-3.0, 3.0, (2, 2))
+        circle = np.r_[rng.uniform(-3.0, 3.0, 2), rng.uniform(0.1, 1.5)]
+        assert m.detect_collisions(line_seg, [circle]) == \
+            m.detect_collision(line_seg, circle)
+
+
+def test_detect_collisions_boundary():
+    line_seg = np.array([[0.0, 0.0], [2.0, 0.0]])
+    # closest point inside the segment / at its end, dist == radius
+    for circle in [[1.0, 0.5, 0.5], [3.0, 0.0, 1.0]]:
+        assert m.detect_collision(line_seg, circle)
+        assert m.detect_collisions(line_seg, [circle])
+
+
+def test_occupancy_grid():
+    arm = m.NLinkArm([1, 1], [0, 0])
+    grid = m.get_occupancy_grid(arm, m.obstacles)
+    assert grid.dtype == np.int8
+    assert grid.shape == (m.M, m.M)
+    # theta1 = -pi/2, theta2 = 0: the arm passes through [0, -1, 0.25]
+    assert grid[m.M // 4, m.M // 2] == 1
+    # theta1 = theta2 = 0: the arm lies along the x axis, clear of obstacles
+    assert grid[m.M // 2, m.M // 2] == 0
+
+
+def test_occupancy_grid_without_obstacles():
+    arm = m.NLinkArm([1, 1], [0, 0])
+    grid = m.get_occupancy_grid(arm, [])
+    assert not grid.any()
+
+
+def test_occupancy_grid_requires_two_links():
+    arm = m.NLinkArm([1, 1, 1], [0, 0, 0])
+    with pytest.raises(ValueError):
+        m.get_occupancy_grid(arm, m.obstacles)
+
+
+if __name__ == '__main__':
+    conftest.run_this_test(__file__)
@@ -1,6 +1,7 @@
 import conftest  # Add root path to sys.path
 from ArmNavigation.n_joint_arm_to_point_control\
     import n_joint_arm_to_point_control as m
+import numpy as np
 import random
 
 random.seed(12345)
@@ -11,5 +12,31 @@ def test1():
     m.animation()
 
 
+def test_jacobian_matches_finite_difference():
+    rng = np.random.default_rng(12345)
+    link_lengths = rng.uniform(0.5, 1.5, m.N_LINKS)
+    joint_angles = rng.uniform(-np.pi, np.pi, m.N_LINKS)
+    eps = 1e-6
+    J_fd = np.zeros((2, m.N_LINKS))
+    for i in range(m.N_LINKS):
+        d = np.zeros(m.N_LINKS)
+        d[i] = eps
+        J_fd[:, i] = (m.forward_kinematics(link_lengths, joint_angles + d)
+                      - m.forward_kinematics(link_lengths, joint_angles - d)
+                      ) / (2.0 * eps)
+    J = m.jacobian(link_lengths, joint_angles)
+    assert np.allclose(J, J_fd, atol=1e-8)
+
+
+def test_inverse_kinematics_converges():
+    link_lengths = [1] * m.N_LINKS
+    goal_pos = np.array([3.0, -4.0])
+    joint_angles, solution_found = m.inverse_kinematics(
+        link_lengths, np.array([0] * m.N_LINKS), goal_pos)
+    assert solution_found
+    current_pos = m.forward_kinematics(link_lengths, joint_angles)
+    assert np.hypot(*(current_pos - goal_pos)) < 0.1
+
+
 if __name__ == '__main__':
     conftest.run_this_test(__file__)